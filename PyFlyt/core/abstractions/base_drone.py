@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 import os
 from abc import ABC, abstractmethod
 
@@ -10,6 +11,7 @@ from pybullet_utils import bullet_client
 
 from PyFlyt.core.abstractions.base_controller import ControlClass
 from PyFlyt.core.abstractions.camera import Camera
+from PyFlyt.core.utils.compile_helpers import jitter
 
 
 class DroneClass(ABC):
@@ -121,8 +123,12 @@ class DroneClass(ABC):
             flags=self.p.URDF_USE_INERTIA_FROM_FILE,
         )
 
+        # pybullet calls used by `update_state` on every physics step, see `PyFlyt.core.utils.bullet_helpers`
+        self._get_pos_orn = self.p.getBasePositionAndOrientation
+        self._get_vel = self.p.getBaseVelocity
+
         """DEFINE STATE AND SETPOINT"""
-        self.state: np.ndarray
+        self.state: np.ndarray = np.zeros((4, 3), dtype=np.float64)
         self.aux_state: np.ndarray
         self.setpoint: np.ndarray
 
@@ -255,7 +261,10 @@ class DroneClass(ABC):
 
         # for custom modes
         if mode in self.registered_controllers.keys():
-            self.instanced_controllers[mode] = self.registered_controllers[mode]()
+            # controllers are only constructed once and reset on every mode change
+            if mode not in self.instanced_controllers:
+                self.instanced_controllers[mode] = self.registered_controllers[mode]()
+            self.instanced_controllers[mode].reset()
             mode = self.registered_base_modes[mode]
 
     def register_controller(
@@ -283,6 +292,12 @@ class DroneClass(ABC):
         self.registered_controllers[controller_id] = controller_constructor
         self.registered_base_modes[controller_id] = base_mode
 
+        # drop the stale instance, or swap it out straight away if it is currently flying
+        self.instanced_controllers.pop(controller_id, None)
+        if controller_id == getattr(self, "mode", None):
+            self.instanced_controllers[controller_id] = controller_constructor()
+            self.instanced_controllers[controller_id].reset()
+
     def get_joint_info(self) -> None:
         """Debugging function for displaying all joint IDs and names as defined in URDF."""
         # read out all infos
@@ -302,3 +317,78 @@ class DroneClass(ABC):
         """Disable the artificial damping that pybullet has to enable more accurate aerodynamics simulation."""
         for idx in range(-1, self.p.getNumJoints(self.Id)):
             self.p.changeDynamics(self.Id, idx, linearDamping=0.0, angularDamping=0.0)
+
+    @staticmethod
+    @jitter
+    def _jitted_compute_state(
+        state: np.ndarray,
+        lin_pos: tuple[float, float, float],
+        quaternion: tuple[float, float, float, float],
+        lin_vel: tuple[float, float, float],
+        ang_vel: tuple[float, float, float],
+    ) -> np.ndarray:
+        """Computes the state of the vehicle from the raw base pose and velocities returned by PyBullet.
+
+        This follows the conventions of PyBullet's `getMatrixFromQuaternion` and `getEulerFromQuaternion`.
+        The state is written in place so that the same buffer is reused on every physics step.
+
+        Args:
+            state (np.ndarray): (4, 3) state array of the vehicle, overwritten in place
+            lin_pos (tuple[float, float, float]): ground frame linear position
+            quaternion (tuple[float, float, float, float]): ground frame orientation in (x, y, z, w)
+            lin_vel (tuple[float, float, float]): ground frame linear velocity
+            ang_vel (tuple[float, float, float]): ground frame angular velocity
+
+        Returns:
+            np.ndarray: the (3, 3) ground to body rotation matrix
+
+        """
+        x, y, z, w = quaternion
+
+        # rotation matrix from quaternion, transposed to go from ground to body frame
+        s = 2.0 / (x * x + y * y + z * z + w * w)
+        rotation = np.empty((3, 3), dtype=np.float64)
+        rotation[0, 0] = 1.0 - s * (y * y + z * z)
+        rotation[1, 0] = s * (x * y - w * z)
+        rotation[2, 0] = s * (x * z + w * y)
+        rotation[0, 1] = s * (x * y + w * z)
+        rotation[1, 1] = 1.0 - s * (x * x + z * z)
+        rotation[2, 1] = s * (y * z - w * x)
+        rotation[0, 2] = s * (x * z - w * y)
+        rotation[1, 2] = s * (y * z + w * x)
+        rotation[2, 2] = 1.0 - s * (x * x + y * y)
+
+        for i in range(3):
+            # express vels in local frame
+            state[0, i] = (
+                rotation[i, 0] * ang_vel[0]
+                + rotation[i, 1] * ang_vel[1]
+                + rotation[i, 2] * ang_vel[2]
+            )
+            state[2, i] = (
+                rotation[i, 0] * lin_vel[0]
+                + rotation[i, 1] * lin_vel[1]
+                + rotation[i, 2] * lin_vel[2]
+            )
+            state[3, i] = lin_pos[i]
+
+        # ang_pos in euler form, near gimbal lock pybullet zeroes roll and folds it into yaw
+        sarg = -2.0 * (x * z - w * y)
+        if sarg <= -0.99999:
+            state[1, 0] = 0.0
+            state[1, 1] = -0.5 * math.pi
+            state[1, 2] = 2.0 * math.atan2(x, -y)
+        elif sarg >= 0.99999:
+            state[1, 0] = 0.0
+            state[1, 1] = 0.5 * math.pi
+            state[1, 2] = 2.0 * math.atan2(-x, y)
+        else:
+            state[1, 0] = math.atan2(
+                2.0 * (y * z + w * x), w * w - x * x - y * y + z * z
+            )
+            state[1, 1] = math.asin(sarg)
+            state[1, 2] = math.atan2(
+                2.0 * (x * y + w * z), w * w + x * x - y * y - z * z
+            )
+
+        return rotation
@@ -7,6 +7,8 @@ from typing import Sequence
 import numpy as np
 from pybullet_utils import bullet_client
 
+from PyFlyt.core.utils.bullet_helpers import LINK_FRAME, ZERO_POSITION
+
 
 class BoringBodies:
     """Vectorized implementation of a series of plain bodies affected by aerodynamics.
@@ -65,6 +67,10 @@ class BoringBodies:
         # runtime parameters
         self.local_body_velocities = np.zeros((len(self.body_ids), 3))
 
+        # pybullet calls used on every physics step
+        self._get_link_states = self.p.getLinkStates
+        self._apply_external_force = self.p.applyExternalForce
+
     def reset(self):
         """Reset the boring bodies."""
         self.local_body_velocities = np.zeros((len(self.body_ids), 3))
@@ -83,7 +89,7 @@ class BoringBodies:
 
         """
         # get all the states for all the bodies
-        link_states = self.p.getLinkStates(
+        link_states = self._get_link_states(
             self.uav_id, self.body_ids, computeLinkVelocity=True
         )
 
@@ -113,15 +119,15 @@ class BoringBodies:
     def physics_update(self):
         """Applies a force to the boring bodies depending on their local surface velocities."""
         forces = (
-            -np.sign(self.local_body_velocities)
-            * self.drag_consts
-            * self.local_body_velocities**2
+            -self.drag_consts
+            * self.local_body_velocities
+            * np.abs(self.local_body_velocities)
         )
         for i, force in enumerate(forces):
-            self.p.applyExternalForce(
+            self._apply_external_force(
                 self.uav_id,
                 self.body_ids[i],
                 force,
-                [0.0, 0.0, 0.0],
-                self.p.LINK_FRAME,
+                ZERO_POSITION,
+                LINK_FRAME,
             )
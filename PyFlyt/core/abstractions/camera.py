@@ -83,6 +83,10 @@ class Camera:
         self.camera_angle_degrees = camera_angle_degrees
         self.camera_FOV_degrees = camera_FOV_degrees
         self.camera_resolution = np.array(camera_resolution)
+        self._image_shape = (int(camera_resolution[0]), int(camera_resolution[1]), -1)
+
+        # pybullet built with numpy support hands back images as arrays directly
+        self._numpy_enabled = bool(self.p.isNumpyEnabled())
 
         # handle camera offset
         self.camera_position_offset = camera_position_offset
@@ -116,23 +120,30 @@ class Camera:
             position += np.matmul(offset_rotation, self.camera_position_offset)
 
         # simulate gimballed camera if needed
-        rotation = np.array(self.p.getEulerFromQuaternion(camera_state[1]))
+        roll, pitch, yaw = self.p.getEulerFromQuaternion(camera_state[1])
         if self.use_gimbal:
             # camera tilted downward for gimballed mode
-            rotation[0] = 0.0
-            rotation[1] = -self.camera_angle_degrees / 180 * math.pi
+            roll = 0.0
+            pitch = -self.camera_angle_degrees / 180 * math.pi
         else:
             # camera tilted upward for FPV mode
-            rotation[1] += self.camera_angle_degrees / 180 * math.pi
-        rotation = np.array(self.p.getQuaternionFromEuler(rotation))
-        rotation = np.array(self.p.getMatrixFromQuaternion(rotation)).reshape(3, 3)
-        up_vector = np.matmul(rotation, np.array([0.0, 0.0, 1.0]))
+            pitch += self.camera_angle_degrees / 180 * math.pi
+
+        # the forward and up vectors are the first and last columns of the ZYX rotation matrix
+        cx, sx = math.cos(roll), math.sin(roll)
+        cy, sy = math.cos(pitch), math.sin(pitch)
+        cz, sz = math.cos(yaw), math.sin(yaw)
+        up_vector = (cz * sy * cx + sz * sx, sz * sy * cx - cz * sx, cy * cx)
 
         # where does the camera have the best focus
         if self.is_tracking_camera:
             target = camera_state[0]
         else:
-            target = np.matmul(rotation, np.array([1000, 0, 0])) + position
+            target = (
+                1000.0 * cz * cy + position[0],
+                1000.0 * sz * cy + position[1],
+                -1000.0 * sy + position[2],
+            )
 
         return self.p.computeViewMatrix(
             cameraEyePosition=position,
@@ -170,14 +181,14 @@ class Camera:
             projectionMatrix=self.proj_mat,
         )
 
-        rgbaImg = np.asarray(rgbaImg).reshape(
-            self.camera_resolution[0], self.camera_resolution[1], -1
-        )
-        depthImg = np.asarray(depthImg).reshape(
-            self.camera_resolution[0], self.camera_resolution[1], -1
-        )
-        segImg = np.asarray(segImg).reshape(
-            self.camera_resolution[0], self.camera_resolution[1], -1
-        )
+        # without numpy support, pybullet returns flat tuples that convert faster with a known dtype
+        if not self._numpy_enabled:
+            rgbaImg = np.fromiter(rgbaImg, dtype=np.uint8, count=len(rgbaImg))
+            depthImg = np.fromiter(depthImg, dtype=np.float32, count=len(depthImg))
+            segImg = np.fromiter(segImg, dtype=np.int32, count=len(segImg))
+
+        rgbaImg = rgbaImg.reshape(self._image_shape)
+        depthImg = depthImg.reshape(self._image_shape)
+        segImg = segImg.reshape(self._image_shape)
 
         return rgbaImg, depthImg, segImg
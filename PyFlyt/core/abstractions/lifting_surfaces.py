@@ -7,6 +7,7 @@ import warnings
 import numpy as np
 from pybullet_utils import bullet_client
 
+from PyFlyt.core.utils.bullet_helpers import LINK_FRAME, ZERO_POSITION
 from PyFlyt.core.utils.compile_helpers import jitter
 
 
@@ -39,6 +40,9 @@ class LiftingSurfaces:
         self.surfaces: list[LiftingSurface] = lifting_surfaces
         self.surface_ids = np.array([s.surface_id for s in self.surfaces])
 
+        # pybullet calls used on every physics step
+        self._get_link_states = self.p.getLinkStates
+
     def reset(self):
         """Resets all lifting surfaces."""
         [surface.reset() for surface in self.surfaces]
@@ -78,7 +82,7 @@ class LiftingSurfaces:
 
         """
         # get all the states for all the surfaces
-        link_states = self.p.getLinkStates(
+        link_states = self._get_link_states(
             self.uav_id, self.surface_ids, computeLinkVelocity=True
         )
 
@@ -241,6 +245,10 @@ class LiftingSurface:
         # runtime parameters
         self.local_surface_velocity = np.array([0.0, 0.0, 0.0])
 
+        # pybullet calls used on every physics step
+        self._apply_external_force = self.p.applyExternalForce
+        self._apply_external_torque = self.p.applyExternalTorque
+
     def reset(self):
         """Reset the lifting surfaces."""
         self.actuation = 0.0
@@ -312,16 +320,14 @@ class LiftingSurface:
             self.torque_unit,
         )
 
-        self.p.applyExternalForce(
+        self._apply_external_force(
             self.uav_id,
             self.surface_id,
             force,
-            [0.0, 0.0, 0.0],
-            self.p.LINK_FRAME,
-        )
-        self.p.applyExternalTorque(
-            self.uav_id, self.surface_id, torque, self.p.LINK_FRAME
+            ZERO_POSITION,
+            LINK_FRAME,
         )
+        self._apply_external_torque(self.uav_id, self.surface_id, torque, LINK_FRAME)
 
     @staticmethod
     @jitter
@@ -7,6 +7,7 @@ import warnings
 import numpy as np
 from pybullet_utils import bullet_client
 
+from PyFlyt.core.utils.bullet_helpers import LINK_FRAME, ZERO_POSITION
 from PyFlyt.core.utils.compile_helpers import jitter
 
 
@@ -90,6 +91,10 @@ class Motors:
         self.thrust_unit = thrust_unit[..., None]
         self.noise_ratio = noise_ratio
 
+        # pybullet calls used on every physics step
+        self._apply_external_force = self.p.applyExternalForce
+        self._apply_external_torque = self.p.applyExternalTorque
+
     def reset(self) -> None:
         """Reset the motors."""
         self.throttle = np.zeros((self.num_motors,))
@@ -117,8 +122,8 @@ class Motors:
             rotation (np.ndarray): (num_motors, 3, 3) rotation matrices to rotate each booster's thrust axis around, this is readily obtained from the `gimbals` component.
 
         """
-        assert np.all(pwm >= -1.0) and np.all(
-            pwm <= 1.0
+        assert (
+            np.abs(pwm).max() <= 1.0
         ), f"`{pwm=} has values out of bounds of -1.0 and 1.0.`"
         if rotation is not None:
             assert rotation.shape == (
@@ -147,12 +152,10 @@ class Motors:
             self.torque_coef,
         )
 
-        # apply the forces
-        for idx, thr, tor in zip(self.motor_ids, thrust, torque):
-            self.p.applyExternalForce(
-                self.uav_id, idx, thr, [0.0, 0.0, 0.0], self.p.LINK_FRAME
-            )
-            self.p.applyExternalTorque(self.uav_id, idx, tor, self.p.LINK_FRAME)
+        # apply the forces, plain lists are much faster for pybullet to parse than array rows
+        for idx, thr, tor in zip(self.motor_ids, thrust.tolist(), torque.tolist()):
+            self._apply_external_force(self.uav_id, idx, thr, ZERO_POSITION, LINK_FRAME)
+            self._apply_external_torque(self.uav_id, idx, tor, LINK_FRAME)
 
     @staticmethod
     @jitter
@@ -187,8 +190,8 @@ class Motors:
         else:
             thrust_unit = thrust_unit[..., 0]
 
-        # rpm to thrust and torque
-        rpm_const = (rpm**2) * np.sign(rpm) * thrust_unit
+        # rpm to thrust and torque, `rpm * |rpm|` is the signed square of rpm
+        rpm_const = rpm * np.abs(rpm) * thrust_unit
         thrust = rpm_const * thrust_coef
         torque = rpm_const * torque_coef
 
@@ -341,6 +341,8 @@ class Aviary(bullet_client.BulletClient):
             - `state[2, :]` represents body frame linear velocity
             - `state[3, :]` represents ground frame linear position
 
+        The returned array is updated in place on every step, `.copy()` it to keep a snapshot.
+
         Args:
             index (DRONE_INDEX): index
 
@@ -380,6 +382,7 @@ class Aviary(bullet_client.BulletClient):
             - `state[2, :]` represents body frame linear velocity
             - `state[3, :]` represents ground frame linear position
 
+        As with `state`, each array is updated in place on every step.
         This function is not very optimized, if you want the state of a single drone, do `state(i)`.
 
         Returns:
@@ -506,21 +509,29 @@ class Aviary(bullet_client.BulletClient):
         # reset collisions
         self.contact_array &= False
 
+        # pybullet calls used in the loop below
+        step_simulation = self.stepSimulation
+        get_contact_points = self.getContactPoints
+
         # step the environment enough times for one control loop of the slowest controller
         for _ in range(self.updates_per_step):
-            # update control and physics
-            [drone.update_control(self.physics_steps) for drone in self.armed_drones]
-            [drone.update_physics() for drone in self.armed_drones]
+            # update control and physics, forces only take effect on `stepSimulation`
+            # so each drone can be handled in a single pass
+            for drone in self.armed_drones:
+                drone.update_control(self.physics_steps)
+                drone.update_physics()
 
             # advance pybullet
-            self.stepSimulation()
+            step_simulation()
 
             # update states and camera
-            [drone.update_state() for drone in self.armed_drones]
-            [drone.update_last(self.physics_steps) for drone in self.armed_drones]
+            for drone in self.armed_drones:
+                drone.update_state()
+            for drone in self.armed_drones:
+                drone.update_last(self.physics_steps)
 
             # splice out collisions
-            for collision in self.getContactPoints():
+            for collision in get_contact_points():
                 self.contact_array[collision[1], collision[2]] = True
                 self.contact_array[collision[2], collision[1]] = True
 
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import numpy as np
-import yaml
 from pybullet_utils import bullet_client
 
 from PyFlyt.core.abstractions.base_drone import DroneClass
 from PyFlyt.core.abstractions.camera import Camera
 from PyFlyt.core.abstractions.lifting_surfaces import LiftingSurface, LiftingSurfaces
 from PyFlyt.core.abstractions.motors import Motors
+from PyFlyt.core.utils.load_params import load_drone_params
 
 
 class Fixedwing(DroneClass):
@@ -70,102 +70,101 @@ class Fixedwing(DroneClass):
         self.starting_velocity = starting_velocity
 
         """Reads fixedwing.yaml file and load UAV parameters"""
-        with open(self.param_path, "rb") as f:
-            # load all params from yaml
-            all_params = yaml.safe_load(f)
-
-            # all lifting surfaces
-            surfaces = list()
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=3,
-                    lifting_unit=np.array([0.0, 0.0, 1.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["left_wing_flapped_params"],
-                )
-            )
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=4,
-                    lifting_unit=np.array([0.0, 0.0, 1.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["right_wing_flapped_params"],
-                )
-            )
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=1,
-                    lifting_unit=np.array([0.0, 0.0, 1.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["horizontal_tail_params"],
-                )
+        # load all params, the parsed yaml is cached between drones of the same model
+        all_params = load_drone_params(self.param_path)
+
+        # all lifting surfaces
+        surfaces = list()
+        surfaces.append(
+            LiftingSurface(
+                p=self.p,
+                physics_period=self.physics_period,
+                np_random=self.np_random,
+                uav_id=self.Id,
+                surface_id=3,
+                lifting_unit=np.array([0.0, 0.0, 1.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **all_params["left_wing_flapped_params"],
             )
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=2,
-                    lifting_unit=np.array([0.0, 1.0, 0.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["vertical_tail_params"],
-                )
+        )
+        surfaces.append(
+            LiftingSurface(
+                p=self.p,
+                physics_period=self.physics_period,
+                np_random=self.np_random,
+                uav_id=self.Id,
+                surface_id=4,
+                lifting_unit=np.array([0.0, 0.0, 1.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **all_params["right_wing_flapped_params"],
             )
-            surfaces.append(
-                LiftingSurface(
-                    p=self.p,
-                    physics_period=self.physics_period,
-                    np_random=self.np_random,
-                    uav_id=self.Id,
-                    surface_id=5,
-                    lifting_unit=np.array([0.0, 0.0, 1.0]),
-                    forward_unit=np.array([1.0, 0.0, 0.0]),
-                    **all_params["main_wing_params"],
-                )
+        )
+        surfaces.append(
+            LiftingSurface(
+                p=self.p,
+                physics_period=self.physics_period,
+                np_random=self.np_random,
+                uav_id=self.Id,
+                surface_id=1,
+                lifting_unit=np.array([0.0, 0.0, 1.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **all_params["horizontal_tail_params"],
             )
-            self.lifting_surfaces = LiftingSurfaces(lifting_surfaces=surfaces)
-
-            # mapping for RPYT -> LeftAil, RightAil, HorStab, VertStab, MainWing, Motor
-            # signs for each control surface when under assist
-            self.surface_assist_ids = np.array([0, 0, 1, 1, 2, 3])
-            self.surface_assist_signs = np.array([1.0, -1.0, 1.0, -1.0, 0.0, 1.0])
-
-            # motor
-            motor_params = all_params["motor_params"]
-            tau = np.array([motor_params["tau"]])
-            max_rpm = np.array([1.0]) * np.sqrt(
-                (motor_params["total_thrust"]) / motor_params["thrust_coef"]
+        )
+        surfaces.append(
+            LiftingSurface(
+                p=self.p,
+                physics_period=self.physics_period,
+                np_random=self.np_random,
+                uav_id=self.Id,
+                surface_id=2,
+                lifting_unit=np.array([0.0, 1.0, 0.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **all_params["vertical_tail_params"],
             )
-            thrust_coef = np.array([motor_params["thrust_coef"]])
-            torque_coef = np.array([motor_params["torque_coef"]])
-            thrust_unit = np.array([[1.0, 0.0, 0.0]])
-            noise_ratio = np.array([motor_params["noise_ratio"]])
-            self.motors = Motors(
+        )
+        surfaces.append(
+            LiftingSurface(
                 p=self.p,
                 physics_period=self.physics_period,
                 np_random=self.np_random,
                 uav_id=self.Id,
-                motor_ids=[0],
-                tau=tau,
-                max_rpm=max_rpm,
-                thrust_coef=thrust_coef,
-                torque_coef=torque_coef,
-                thrust_unit=thrust_unit,
-                noise_ratio=noise_ratio,
+                surface_id=5,
+                lifting_unit=np.array([0.0, 0.0, 1.0]),
+                forward_unit=np.array([1.0, 0.0, 0.0]),
+                **all_params["main_wing_params"],
             )
+        )
+        self.lifting_surfaces = LiftingSurfaces(lifting_surfaces=surfaces)
+
+        # mapping for RPYT -> LeftAil, RightAil, HorStab, VertStab, MainWing, Motor
+        # signs for each control surface when under assist
+        self.surface_assist_ids = np.array([0, 0, 1, 1, 2, 3])
+        self.surface_assist_signs = np.array([1.0, -1.0, 1.0, -1.0, 0.0, 1.0])
+
+        # motor
+        motor_params = all_params["motor_params"]
+        tau = np.array([motor_params["tau"]])
+        max_rpm = np.array([1.0]) * np.sqrt(
+            (motor_params["total_thrust"]) / motor_params["thrust_coef"]
+        )
+        thrust_coef = np.array([motor_params["thrust_coef"]])
+        torque_coef = np.array([motor_params["torque_coef"]])
+        thrust_unit = np.array([[1.0, 0.0, 0.0]])
+        noise_ratio = np.array([motor_params["noise_ratio"]])
+        self.motors = Motors(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            motor_ids=[0],
+            tau=tau,
+            max_rpm=max_rpm,
+            thrust_coef=thrust_coef,
+            torque_coef=torque_coef,
+            thrust_unit=thrust_unit,
+            noise_ratio=noise_ratio,
+        )
 
         """ CAMERA """
         self.use_camera = use_camera
@@ -268,19 +267,13 @@ class Fixedwing(DroneClass):
 
         This includes: ang_vel, ang_pos, lin_vel, lin_pos.
         """
-        lin_pos, ang_pos = self.p.getBasePositionAndOrientation(self.Id)
-        lin_vel, ang_vel = self.p.getBaseVelocity(self.Id)
+        lin_pos, ang_pos = self._get_pos_orn(self.Id)
+        lin_vel, ang_vel = self._get_vel(self.Id)
 
-        # express vels in local frame
-        rotation = np.array(self.p.getMatrixFromQuaternion(ang_pos)).reshape(3, 3).T
-        lin_vel = np.matmul(rotation, lin_vel)
-        ang_vel = np.matmul(rotation, ang_vel)
-
-        # ang_pos in euler form
-        ang_pos = self.p.getEulerFromQuaternion(ang_pos)
-
-        # create the state
-        self.state = np.stack([ang_vel, ang_pos, lin_vel, lin_pos], axis=0)
+        # update the state in place, with vels in the local frame and ang_pos in euler form
+        rotation = self._jitted_compute_state(
+            self.state, lin_pos, ang_pos, lin_vel, ang_vel
+        )
 
         # update all lifting surface velocities
         self.lifting_surfaces.state_update(rotation)
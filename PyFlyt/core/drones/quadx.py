@@ -5,7 +5,6 @@ from __future__ import annotations
 import math
 
 import numpy as np
-import yaml
 from pybullet_utils import bullet_client
 
 from PyFlyt.core.abstractions.base_controller import ControlClass
@@ -13,7 +12,18 @@ from PyFlyt.core.abstractions.base_drone import DroneClass
 from PyFlyt.core.abstractions.boring_bodies import BoringBodies
 from PyFlyt.core.abstractions.camera import Camera
 from PyFlyt.core.abstractions.motors import Motors
-from PyFlyt.core.abstractions.pid import PID
+from PyFlyt.core.utils.bullet_helpers import LINK_FRAME
+from PyFlyt.core.utils.compile_helpers import jitter
+from PyFlyt.core.utils.load_params import load_drone_params
+
+# offsets of each controller within the flattened controller gains and states
+_ANG_VEL = 0
+_ANG_POS = 3
+_LIN_VEL = 6
+_LIN_POS = 8
+_Z_POS = 10
+_Z_VEL = 11
+_NUM_PID_CHANNELS = 12
 
 
 class QuadX(DroneClass):
@@ -81,120 +91,107 @@ class QuadX(DroneClass):
         """
 
         # All the params for the drone
-        with open(self.param_path, "rb") as f:
-            # load all params from yaml
-            all_params = yaml.safe_load(f)
-            motor_params = all_params["motor_params"]
-            drag_params = all_params["drag_params"]
-            ctrl_params = all_params["control_params"]
-
-            # motor thrust and torque constants
-            motor_ids = [0, 1, 2, 3]
-            thrust_coef = np.array([motor_params["thrust_coef"]] * 4)
-            torque_coef = np.array(
-                [
-                    -motor_params["torque_coef"],
-                    -motor_params["torque_coef"],
-                    +motor_params["torque_coef"],
-                    +motor_params["torque_coef"],
-                ]
-            )
-            thrust_unit = np.array(
-                [
-                    [0.0, 0.0, 1.0],
-                    [0.0, 0.0, 1.0],
-                    [0.0, 0.0, 1.0],
-                    [0.0, 0.0, 1.0],
-                ]
-            )
-            noise_ratio = np.array([1.0] * 4) * motor_params["noise_ratio"]
-            max_rpm = np.array([1.0] * 4) * np.sqrt(
-                (motor_params["total_thrust"]) / (4 * motor_params["thrust_coef"])
-            )
-            tau = np.array([1.0] * 4) * motor_params["tau"]
-            self.motors = Motors(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                uav_id=self.Id,
-                motor_ids=motor_ids,
-                tau=tau,
-                max_rpm=max_rpm,
-                thrust_coef=thrust_coef,
-                torque_coef=torque_coef,
-                thrust_unit=thrust_unit,
-                noise_ratio=noise_ratio,
-            )
+        # load all params, the parsed yaml is cached between drones of the same model
+        all_params = load_drone_params(self.param_path)
+        motor_params = all_params["motor_params"]
+        drag_params = all_params["drag_params"]
+        ctrl_params = all_params["control_params"]
+
+        # motor thrust and torque constants
+        motor_ids = [0, 1, 2, 3]
+        thrust_coef = np.array([motor_params["thrust_coef"]] * 4)
+        torque_coef = np.array(
+            [
+                -motor_params["torque_coef"],
+                -motor_params["torque_coef"],
+                +motor_params["torque_coef"],
+                +motor_params["torque_coef"],
+            ]
+        )
+        thrust_unit = np.array(
+            [
+                [0.0, 0.0, 1.0],
+                [0.0, 0.0, 1.0],
+                [0.0, 0.0, 1.0],
+                [0.0, 0.0, 1.0],
+            ]
+        )
+        noise_ratio = np.array([1.0] * 4) * motor_params["noise_ratio"]
+        max_rpm = np.array([1.0] * 4) * np.sqrt(
+            (motor_params["total_thrust"]) / (4 * motor_params["thrust_coef"])
+        )
+        tau = np.array([1.0] * 4) * motor_params["tau"]
+        self.motors = Motors(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            motor_ids=motor_ids,
+            tau=tau,
+            max_rpm=max_rpm,
+            thrust_coef=thrust_coef,
+            torque_coef=torque_coef,
+            thrust_unit=thrust_unit,
+            noise_ratio=noise_ratio,
+        )
 
-            # motor mapping from command to individual motors
-            self.motor_map = np.array(
+        # motor mapping from command to individual motors
+        self.motor_map = np.array(
+            [
+                [-1.0, -1.0, -1.0, +1.0],
+                [+1.0, +1.0, -1.0, +1.0],
+                [+1.0, -1.0, +1.0, +1.0],
+                [-1.0, +1.0, +1.0, +1.0],
+            ]
+        )
+
+        # pseudo drag coef
+        self.drag_coef_pqr = drag_params["drag_coef_pqr"]
+
+        # simulate the drag on the main body
+        self.body = BoringBodies(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            body_ids=np.array([4]),
+            drag_coefs=np.array([[drag_params["drag_coef_xyz"]] * 3]),
+            normal_areas=np.array([[drag_params["drag_area_xyz"]] * 3]),
+        )
+
+        # flattened gains for the cascaded controllers, in the order of:
+        #   ang_vel (3), ang_pos (3), lin_vel (2), lin_pos (2), z_pos (1), z_vel (1)
+        # ang_vel outputs normalized body torque commands
+        # ang_pos outputs angular velocity commands
+        # lin_vel outputs angular position commands
+        # lin_pos outputs linear velocity commands
+        # z_pos outputs z velocity commands
+        # z_vel outputs normalized thrust commands
+        ctrl_stages = ["ang_vel", "ang_pos", "lin_vel", "lin_pos", "z_pos", "z_vel"]
+        self.ctrl_kp, self.ctrl_ki, self.ctrl_kd, self.ctrl_lim = (
+            np.concatenate(
                 [
-                    [-1.0, -1.0, -1.0, +1.0],
-                    [+1.0, +1.0, -1.0, +1.0],
-                    [+1.0, -1.0, +1.0, +1.0],
-                    [-1.0, +1.0, +1.0, +1.0],
+                    np.array(ctrl_params[stage][gain], dtype=np.float64).flatten()
+                    for stage in ctrl_stages
                 ]
             )
+            for gain in ["kp", "ki", "kd", "lim"]
+        )
+        assert self.ctrl_kp.shape == (
+            _NUM_PID_CHANNELS,
+        ), f"Expected {_NUM_PID_CHANNELS} controller gains in total, got {self.ctrl_kp.shape[0]}."
 
-            # pseudo drag coef
-            self.drag_coef_pqr = drag_params["drag_coef_pqr"]
+        # runtime states of the controllers
+        self.pid_integral = np.zeros((_NUM_PID_CHANNELS,), dtype=np.float64)
+        self.pid_prev_error = np.zeros((_NUM_PID_CHANNELS,), dtype=np.float64)
 
-            # simulate the drag on the main body
-            self.body = BoringBodies(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                uav_id=self.Id,
-                body_ids=np.array([4]),
-                drag_coefs=np.array([[drag_params["drag_coef_xyz"]] * 3]),
-                normal_areas=np.array([[drag_params["drag_area_xyz"]] * 3]),
-            )
+        # pybullet calls used by `update_physics` on every physics step
+        self._get_contacts = self.p.getContactPoints
+        self._apply_external_torque = self.p.applyExternalTorque
 
-            # input: angular velocity command
-            # outputs: normalized body torque command
-            self.Kp_ang_vel = np.array(ctrl_params["ang_vel"]["kp"])
-            self.Ki_ang_vel = np.array(ctrl_params["ang_vel"]["ki"])
-            self.Kd_ang_vel = np.array(ctrl_params["ang_vel"]["kd"])
-            self.lim_ang_vel = np.array(ctrl_params["ang_vel"]["lim"])
-
-            # input: angular position command
-            # outputs: angular velocity command
-            self.Kp_ang_pos = np.array(ctrl_params["ang_pos"]["kp"])
-            self.Ki_ang_pos = np.array(ctrl_params["ang_pos"]["ki"])
-            self.Kd_ang_pos = np.array(ctrl_params["ang_pos"]["kd"])
-            self.lim_ang_pos = np.array(ctrl_params["ang_pos"]["lim"])
-
-            # input: linear velocity command
-            # outputs: angular position command
-            self.Kp_lin_vel = np.array(ctrl_params["lin_vel"]["kp"])
-            self.Ki_lin_vel = np.array(ctrl_params["lin_vel"]["ki"])
-            self.Kd_lin_vel = np.array(ctrl_params["lin_vel"]["kd"])
-            self.lim_lin_vel = np.array(ctrl_params["lin_vel"]["lim"])
-
-            # input: linear position command
-            # outputs: linear velocity
-            self.Kp_lin_pos = np.array(ctrl_params["lin_pos"]["kp"])
-            self.Ki_lin_pos = np.array(ctrl_params["lin_pos"]["ki"])
-            self.Kd_lin_pos = np.array(ctrl_params["lin_pos"]["kd"])
-            self.lim_lin_pos = np.array(ctrl_params["lin_pos"]["lim"])
-
-            # height controllers
-            z_pos_PID = PID(
-                np.array([ctrl_params["z_pos"]["kp"]]),
-                np.array([ctrl_params["z_pos"]["ki"]]),
-                np.array([ctrl_params["z_pos"]["kd"]]),
-                np.array([ctrl_params["z_pos"]["lim"]]),
-                self.control_period,
-            )
-            z_vel_PID = PID(
-                np.array([ctrl_params["z_vel"]["kp"]]),
-                np.array([ctrl_params["z_vel"]["ki"]]),
-                np.array([ctrl_params["z_vel"]["kd"]]),
-                np.array([ctrl_params["z_vel"]["lim"]]),
-                self.control_period,
-            )
-            self.z_PIDs = [z_vel_PID, z_pos_PID]
-            self.PIDs = []
+        # buffers for the motor commands and preset setpoints, reused on every step
+        self.pwm = np.zeros((4,), dtype=np.float64)
+        self._preset_setpoint = np.zeros((4,), dtype=np.float64)
 
         """ CAMERA """
         self.use_camera = use_camera
@@ -222,8 +219,8 @@ class QuadX(DroneClass):
     def reset(self) -> None:
         """Resets the vehicle to the initial state."""
         self.set_mode(0)
-        self.setpoint = np.zeros(4)
-        self.pwm = np.zeros(4)
+        self.setpoint.fill(0.0)
+        self.pwm.fill(0.0)
 
         self.p.resetBasePositionAndOrientation(self.Id, self.start_pos, self.start_orn)
         self.disable_artificial_damping()
@@ -265,112 +262,40 @@ class QuadX(DroneClass):
 
         # for custom modes
         if mode in self.registered_controllers.keys():
-            self.instanced_controllers[mode] = self.registered_controllers[mode]()
+            # controllers are only constructed once and reset on every mode change
+            if mode not in self.instanced_controllers:
+                self.instanced_controllers[mode] = self.registered_controllers[mode]()
+            self.instanced_controllers[mode].reset()
             mode = self.registered_base_modes[mode]
+            self._update_control_fn = self._update_custom_control
+        else:
+            self._update_control_fn = self._update_base_control
+        self._base_mode = mode
 
         # mode -1 means no controller present
         if mode == -1:
             return
 
         # preset setpoints on mode change
+        # these go into our own buffer, the current setpoint may be a view of the caller's array
+        self.setpoint = self._preset_setpoint
+        self.setpoint.fill(0.0)
         if mode == 0:
             # racing mode, thrust to 0
-            self.setpoint = np.array([0.0, 0.0, 0.0, -1.0])
-        elif mode in [1, 5, 6]:
-            # anything with a vz component, set to 0 vz
-            self.setpoint = np.array([0.0, 0.0, 0.0, 0.0])
+            self.setpoint[-1] = -1.0
         elif mode == 7:
             # position mode just hold position
-            self.setpoint = np.array(
-                [*self.state[-1, :2], self.state[1, -1], self.state[-1, -1]]
-            )
-        else:
+            self.setpoint[:2] = self.state[-1, :2]
+            self.setpoint[2] = self.state[1, -1]
+            self.setpoint[3] = self.state[-1, -1]
+        elif mode not in [1, 5, 6]:
             # everything else set to 0 except z component maintain
-            self.setpoint = np.array([0.0, 0.0, 0.0, 0.0])
+            # anything with a vz component stays at 0 vz
             self.setpoint[-1] = self.state[-1, -1]
 
-        # instantiate PIDs
-        if mode in [0, 2]:
-            ang_vel_PID = PID(
-                self.Kp_ang_vel,
-                self.Ki_ang_vel,
-                self.Kd_ang_vel,
-                self.lim_ang_vel,
-                self.control_period,
-            )
-            self.PIDs = [ang_vel_PID]
-        elif mode in [1, 3]:
-            ang_vel_PID = PID(
-                self.Kp_ang_vel,
-                self.Ki_ang_vel,
-                self.Kd_ang_vel,
-                self.lim_ang_vel,
-                self.control_period,
-            )
-            ang_pos_PID = PID(
-                self.Kp_ang_pos,
-                self.Ki_ang_pos,
-                self.Kd_ang_pos,
-                self.lim_ang_pos,
-                self.control_period,
-            )
-            self.PIDs = [ang_vel_PID, ang_pos_PID]
-        elif mode in [4, 5, 6]:
-            ang_vel_PID = PID(
-                self.Kp_ang_vel,
-                self.Ki_ang_vel,
-                self.Kd_ang_vel,
-                self.lim_ang_vel,
-                self.control_period,
-            )
-            ang_pos_PID = PID(
-                self.Kp_ang_pos[:2],
-                self.Ki_ang_pos[:2],
-                self.Kd_ang_pos[:2],
-                self.lim_ang_pos[:2],
-                self.control_period,
-            )
-            lin_vel_PID = PID(
-                self.Kp_lin_vel,
-                self.Ki_lin_vel,
-                self.Kd_lin_vel,
-                self.lim_lin_vel,
-                self.control_period,
-            )
-            self.PIDs = [ang_vel_PID, ang_pos_PID, lin_vel_PID]
-        elif mode == 7:
-            ang_vel_PID = PID(
-                self.Kp_ang_vel,
-                self.Ki_ang_vel,
-                self.Kd_ang_vel,
-                self.lim_ang_vel,
-                self.control_period,
-            )
-            ang_pos_PID = PID(
-                self.Kp_ang_pos,
-                self.Ki_ang_pos,
-                self.Kd_ang_pos,
-                self.lim_ang_pos,
-                self.control_period,
-            )
-            lin_vel_PID = PID(
-                self.Kp_lin_vel,
-                self.Ki_lin_vel,
-                self.Kd_lin_vel,
-                self.lim_lin_vel,
-                self.control_period,
-            )
-            lin_pos_PID = PID(
-                self.Kp_lin_pos,
-                self.Ki_lin_pos,
-                self.Kd_lin_pos,
-                self.lim_lin_pos,
-                self.control_period,
-            )
-            self.PIDs = [ang_vel_PID, ang_pos_PID, lin_vel_PID, lin_pos_PID]
-
-        for controller in self.PIDs:
-            controller.reset()
+        # reset the attitude and lateral controllers, height controllers are kept running
+        self.pid_integral[:_Z_POS] = 0.0
+        self.pid_prev_error[:_Z_POS] = 0.0
 
     def register_controller(
         self,
@@ -398,6 +323,13 @@ class QuadX(DroneClass):
         self.registered_controllers[controller_id] = controller_constructor
         self.registered_base_modes[controller_id] = base_mode
 
+        # drop the stale instance, or swap it out straight away if it is currently flying
+        self.instanced_controllers.pop(controller_id, None)
+        if controller_id == getattr(self, "mode", None):
+            self.instanced_controllers[controller_id] = controller_constructor()
+            self.instanced_controllers[controller_id].reset()
+            self._base_mode = base_mode
+
     def update_control(self, physics_step: int) -> None:
         """Runs through controllers.
 
@@ -409,88 +341,48 @@ class QuadX(DroneClass):
         if physics_step % self.physics_control_ratio != 0:
             return
 
-        # this is the thing we cascade down controllers
-        a_output = self.setpoint[:3].copy()
-        z_output = self.setpoint[-1].copy()
-        mode = self.mode
-
-        # custom controllers run first if any
-        if self.mode in self.registered_controllers.keys():
-            custom_output = self.instanced_controllers[self.mode].step(
-                self.state, self.setpoint
-            )
-            assert custom_output.shape == (
-                4,
-            ), f"custom controller outputting wrong shape, expected (4, ) but got {custom_output.shape}."
-
-            # splice things out to be passed along
-            a_output = custom_output[:3].copy()
-            z_output = custom_output[-1].copy().flatten()
-            mode = self.registered_base_modes[self.mode]
-
-        # controller -1 means just direct to motor pwm commands
-        if mode == -1:
-            self.pwm = np.array([*a_output, z_output])
-            return
-
-        # base level controllers
-        if mode in [0, 2]:
-            a_output = self.PIDs[0].step(self.state[0], a_output)
-        elif mode in [1, 3]:
-            a_output = self.PIDs[1].step(self.state[1], a_output)
-            a_output = self.PIDs[0].step(self.state[0], a_output)
-        elif mode in [4, 5]:
-            a_output[:2] = self.PIDs[2].step(self.state[2][:2], a_output[:2])
-            a_output[:2] = np.array([-a_output[1], a_output[0]])
-            a_output[:2] = self.PIDs[1].step(self.state[1][:2], a_output[:2])
-            a_output = self.PIDs[0].step(self.state[0], a_output)
-        elif mode == 6:
-            c = math.cos(self.state[1, -1])
-            s = math.sin(self.state[1, -1])
-            rot_mat = np.array([[c, -s], [s, c]]).T
-            a_output[:2] = np.matmul(rot_mat, a_output[:2])
-
-            a_output[:2] = self.PIDs[2].step(self.state[2][:2], a_output[:2])
-            a_output[:2] = np.array([-a_output[1], a_output[0]])
-            a_output[:2] = self.PIDs[1].step(self.state[1][:2], a_output[:2])
-            a_output = self.PIDs[0].step(self.state[0], a_output)
-        elif mode == 7:
-            a_output[:2] = self.PIDs[3].step(self.state[3][:2], a_output[:2])
-
-            c = math.cos(self.state[1, -1])
-            s = math.sin(self.state[1, -1])
-            rot_mat = np.array([[c, -s], [s, c]]).T
-            a_output[:2] = np.matmul(rot_mat, a_output[:2])
-
-            a_output[:2] = self.PIDs[2].step(self.state[2][:2], a_output[:2])
-            a_output = np.array([-a_output[1], a_output[0], a_output[2]])
-            a_output = self.PIDs[1].step(self.state[1], a_output)
-            a_output = self.PIDs[0].step(self.state[0], a_output)
+        self._update_control_fn()
+
+    def _update_base_control(self) -> None:
+        """Runs the base flight mode controllers directly on the setpoint."""
+        _jitted_update_control(
+            self._base_mode,
+            self.state,
+            self.setpoint,
+            self.motor_map,
+            self.ctrl_kp,
+            self.ctrl_ki,
+            self.ctrl_kd,
+            self.ctrl_lim,
+            self.pid_integral,
+            self.pid_prev_error,
+            self.control_period,
+            self.pwm,
+        )
 
-        # height controllers
-        if mode == 0:
-            z_output = np.clip(z_output, 0.0, 1.0).flatten()
-        elif mode in [1, 5, 6]:
-            z_output = self.z_PIDs[0].step(self.state[2][-1].flatten(), z_output)
-            z_output = np.clip(z_output, 0, 1)
-        elif mode in [2, 3, 4, 7]:
-            z_output = self.z_PIDs[1].step(self.state[3][-1].flatten(), z_output)
-            z_output = self.z_PIDs[0].step(self.state[2][-1].flatten(), z_output)
-            z_output = np.clip(z_output, 0, 1)
-
-        # mix the commands according to motor mix
-        cmd = np.array([*a_output, *z_output])
-        self.pwm = np.matmul(self.motor_map, cmd)
-
-        # deal with motor saturations
-        # we want to maintain the output low and output high if possible
-        high, low = np.max(self.pwm), np.min(self.pwm)
-        if high != low:
-            pwm_max, pwm_min = min(high, 1.0), max(low, 0.05)
-            add = (pwm_min - low) / (pwm_max - low) * (pwm_max - self.pwm)
-            sub = (high - pwm_max) / (high - pwm_min) * (self.pwm - pwm_min)
-            self.pwm += add - sub
-        self.pwm = np.clip(self.pwm, 0.05, 1.0)
+    def _update_custom_control(self) -> None:
+        """Runs the custom controller, whose output becomes the setpoint of the base flight mode controllers."""
+        custom_output = self.instanced_controllers[self.mode].step(
+            self.state, self.setpoint
+        )
+        assert custom_output.shape == (
+            4,
+        ), f"custom controller outputting wrong shape, expected (4, ) but got {custom_output.shape}."
+
+        _jitted_update_control(
+            self._base_mode,
+            self.state,
+            custom_output,
+            self.motor_map,
+            self.ctrl_kp,
+            self.ctrl_ki,
+            self.ctrl_kd,
+            self.ctrl_lim,
+            self.pid_integral,
+            self.pid_prev_error,
+            self.control_period,
+            self.pwm,
+        )
 
     def update_physics(self) -> None:
         """Updates the physics of the vehicle."""
@@ -498,39 +390,31 @@ class QuadX(DroneClass):
         self.body.physics_update()
         self.motors.physics_update(self.pwm)
 
-        # simulate rotational damping
-        drag_pqr = (
-            -np.sign(self.state[0])
-            * self.drag_coef_pqr
-            * (np.array(self.state[0]) ** 2)
-        )
-
-        # warning, the physics is funky for bounces
-        if len(self.p.getContactPoints()) == 0:
-            self.p.applyExternalTorque(self.Id, -1, drag_pqr, self.p.LINK_FRAME)
+        # simulate rotational damping, warning, the physics is funky for bounces
+        # only query contacts involving this drone, not the whole world
+        if len(self._get_contacts(bodyA=self.Id)) == 0:
+            # plain floats, numpy dispatch costs more than the math for 3 elements
+            drag_pqr = [
+                -self.drag_coef_pqr * w * abs(w) for w in self.state[0].tolist()
+            ]
+            self._apply_external_torque(self.Id, -1, drag_pqr, LINK_FRAME)
 
     def update_state(self) -> None:
         """Updates the current state of the UAV.
 
         This includes: ang_vel, ang_pos, lin_vel, lin_pos.
         """
-        lin_pos, ang_pos = self.p.getBasePositionAndOrientation(self.Id)
-        lin_vel, ang_vel = self.p.getBaseVelocity(self.Id)
+        lin_pos, ang_pos = self._get_pos_orn(self.Id)
+        lin_vel, ang_vel = self._get_vel(self.Id)
 
-        # express vels in local frame
-        rotation = np.array(self.p.getMatrixFromQuaternion(ang_pos)).reshape(3, 3).T
-        lin_vel = np.matmul(rotation, lin_vel)
-        ang_vel = np.matmul(rotation, ang_vel)
-
-        # ang_pos in euler form
-        ang_pos = self.p.getEulerFromQuaternion(ang_pos)
+        # update the state in place, with vels in the local frame and ang_pos in euler form
+        rotation = self._jitted_compute_state(
+            self.state, lin_pos, ang_pos, lin_vel, ang_vel
+        )
 
         # update the main body
         self.body.state_update(rotation)
 
-        # create the state
-        self.state = np.stack([ang_vel, ang_pos, lin_vel, lin_pos], axis=0)
-
         # update auxiliary information
         self.aux_state = self.motors.get_states()
 
@@ -543,3 +427,226 @@ class QuadX(DroneClass):
         """
         if self.use_camera and (physics_step % self.physics_camera_ratio == 0):
             self.rgbaImg, self.depthImg, self.segImg = self.camera.capture_image()
+
+
+@jitter
+def _jitted_pid_step(
+    offset: int,
+    state: np.ndarray,
+    setpoint: np.ndarray,
+    kp: np.ndarray,
+    ki: np.ndarray,
+    kd: np.ndarray,
+    lim: np.ndarray,
+    integral: np.ndarray,
+    prev_error: np.ndarray,
+    period: float,
+) -> np.ndarray:
+    """Steps a slice of the flattened PID controllers, the controller states are updated in place.
+
+    Args:
+        offset (int): index of the first controller channel in the flattened arrays
+        state (np.ndarray): (n,) array of the current state
+        setpoint (np.ndarray): (n,) array of the target setpoint
+        kp (np.ndarray): ctrl_kp from self
+        ki (np.ndarray): ctrl_ki from self
+        kd (np.ndarray): ctrl_kd from self
+        lim (np.ndarray): ctrl_lim from self
+        integral (np.ndarray): pid_integral from self
+        prev_error (np.ndarray): pid_prev_error from self
+        period (float): control period
+
+    Returns:
+        np.ndarray: (n,) array of controller outputs
+
+    """
+    output = np.empty(state.shape[0], dtype=np.float64)
+    for i in range(state.shape[0]):
+        j = offset + i
+        error = setpoint[i] - state[i]
+
+        integral[j] = min(max(integral[j] + ki[j] * error * period, -lim[j]), lim[j])
+        derivative = kd[j] * (error - prev_error[j]) / period
+        prev_error[j] = error
+
+        output[i] = min(max(kp[j] * error + integral[j] + derivative, -lim[j]), lim[j])
+
+    return output
+
+
+@jitter
+def _jitted_update_control(
+    mode: int,
+    state: np.ndarray,
+    setpoint: np.ndarray,
+    motor_map: np.ndarray,
+    kp: np.ndarray,
+    ki: np.ndarray,
+    kd: np.ndarray,
+    lim: np.ndarray,
+    integral: np.ndarray,
+    prev_error: np.ndarray,
+    period: float,
+    pwm: np.ndarray,
+) -> None:
+    """Runs the cascaded controllers of a base flight mode and mixes the result into motor pwm commands.
+
+    Args:
+        mode (int): base flight mode, from -1 to 7
+        state (np.ndarray): (4, 3) state of the drone
+        setpoint (np.ndarray): (4,) setpoint of the drone
+        motor_map (np.ndarray): motor_map from self
+        kp (np.ndarray): ctrl_kp from self
+        ki (np.ndarray): ctrl_ki from self
+        kd (np.ndarray): ctrl_kd from self
+        lim (np.ndarray): ctrl_lim from self
+        integral (np.ndarray): pid_integral from self
+        prev_error (np.ndarray): pid_prev_error from self
+        period (float): control period
+        pwm (np.ndarray): (4,) array of motor pwm commands, written in place
+
+    """
+    # this is the thing we cascade down controllers
+    a_output = np.empty(3, dtype=np.float64)
+    for i in range(3):
+        a_output[i] = setpoint[i]
+    z_output = np.empty(1, dtype=np.float64)
+    z_output[0] = setpoint[3]
+
+    # controller -1 means just direct to motor pwm commands
+    if mode == -1:
+        pwm[:3] = a_output
+        pwm[3] = z_output[0]
+        return
+
+    # base level controllers
+    if mode == 0 or mode == 2:
+        a_output = _jitted_pid_step(
+            _ANG_VEL, state[0], a_output, kp, ki, kd, lim, integral, prev_error, period
+        )
+    elif mode == 1 or mode == 3:
+        a_output = _jitted_pid_step(
+            _ANG_POS, state[1], a_output, kp, ki, kd, lim, integral, prev_error, period
+        )
+        a_output = _jitted_pid_step(
+            _ANG_VEL, state[0], a_output, kp, ki, kd, lim, integral, prev_error, period
+        )
+    elif mode >= 4:
+        # position mode targets linear velocity
+        if mode == 7:
+            a_output[:2] = _jitted_pid_step(
+                _LIN_POS,
+                state[3, :2],
+                a_output[:2],
+                kp,
+                ki,
+                kd,
+                lim,
+                integral,
+                prev_error,
+                period,
+            )
+
+        # ground frame velocities are rotated into the body frame
+        if mode == 6 or mode == 7:
+            c = math.cos(state[1, 2])
+            s = math.sin(state[1, 2])
+            a_output[0], a_output[1] = (
+                c * a_output[0] + s * a_output[1],
+                -s * a_output[0] + c * a_output[1],
+            )
+
+        a_output[:2] = _jitted_pid_step(
+            _LIN_VEL,
+            state[2, :2],
+            a_output[:2],
+            kp,
+            ki,
+            kd,
+            lim,
+            integral,
+            prev_error,
+            period,
+        )
+        a_output[0], a_output[1] = -a_output[1], a_output[0]
+
+        # position mode also controls yaw angle, the others control yaw rate
+        if mode == 7:
+            a_output = _jitted_pid_step(
+                _ANG_POS,
+                state[1],
+                a_output,
+                kp,
+                ki,
+                kd,
+                lim,
+                integral,
+                prev_error,
+                period,
+            )
+        else:
+            a_output[:2] = _jitted_pid_step(
+                _ANG_POS,
+                state[1, :2],
+                a_output[:2],
+                kp,
+                ki,
+                kd,
+                lim,
+                integral,
+                prev_error,
+                period,
+            )
+        a_output = _jitted_pid_step(
+            _ANG_VEL, state[0], a_output, kp, ki, kd, lim, integral, prev_error, period
+        )
+
+    # height controllers
+    if mode == 2 or mode == 3 or mode == 4 or mode == 7:
+        z_output = _jitted_pid_step(
+            _Z_POS,
+            state[3, 2:],
+            z_output,
+            kp,
+            ki,
+            kd,
+            lim,
+            integral,
+            prev_error,
+            period,
+        )
+    if mode != 0:
+        z_output = _jitted_pid_step(
+            _Z_VEL,
+            state[2, 2:],
+            z_output,
+            kp,
+            ki,
+            kd,
+            lim,
+            integral,
+            prev_error,
+            period,
+        )
+    z = min(max(z_output[0], 0.0), 1.0)
+
+    # mix the commands according to motor mix, tracking the extremes as we go
+    high, low = -np.inf, np.inf
+    for i in range(4):
+        pwm[i] = (
+            motor_map[i, 0] * a_output[0]
+            + motor_map[i, 1] * a_output[1]
+            + motor_map[i, 2] * a_output[2]
+            + motor_map[i, 3] * z
+        )
+        high = max(high, pwm[i])
+        low = min(low, pwm[i])
+
+    # deal with motor saturations
+    # we want to maintain the output low and output high if possible
+    pwm_max, pwm_min = min(high, 1.0), max(low, 0.05)
+    add_ratio = (pwm_min - low) / (pwm_max - low) if high != low else 0.0
+    sub_ratio = (high - pwm_max) / (high - pwm_min) if high != low else 0.0
+    for i in range(4):
+        pwm[i] += add_ratio * (pwm_max - pwm[i]) - sub_ratio * (pwm[i] - pwm_min)
+        pwm[i] = min(max(pwm[i], 0.05), 1.0)
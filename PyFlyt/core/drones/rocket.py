@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import numpy as np
-import yaml
 from pybullet_utils import bullet_client
 
 from PyFlyt.core.abstractions.base_drone import DroneClass
@@ -12,6 +11,7 @@ from PyFlyt.core.abstractions.boring_bodies import BoringBodies
 from PyFlyt.core.abstractions.camera import Camera
 from PyFlyt.core.abstractions.gimbals import Gimbals
 from PyFlyt.core.abstractions.lifting_surfaces import LiftingSurface, LiftingSurfaces
+from PyFlyt.core.utils.load_params import load_drone_params
 
 
 class Rocket(DroneClass):
@@ -82,121 +82,120 @@ class Rocket(DroneClass):
         self.starting_fuel_ratio = starting_fuel_ratio
 
         """Reads fixedwing.yaml file and load UAV parameters"""
-        with open(self.param_path, "rb") as f:
-            # load all params from yaml
-            all_params = yaml.safe_load(f)
-            booster_params = all_params["booster_params"]
-            body_params = all_params["body_params"]
-
-            # add the main body
-            self.bodies = BoringBodies(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                uav_id=self.Id,
-                body_ids=np.array([0]),
-                drag_coefs=np.array(
+        # load all params, the parsed yaml is cached between drones of the same model
+        all_params = load_drone_params(self.param_path)
+        booster_params = all_params["booster_params"]
+        body_params = all_params["body_params"]
+
+        # add the main body
+        self.bodies = BoringBodies(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            body_ids=np.array([0]),
+            drag_coefs=np.array(
+                [
                     [
-                        [
-                            body_params["drag_coef_x"],
-                            body_params["drag_coef_y"],
-                            body_params["drag_coef_z"],
-                        ]
+                        body_params["drag_coef_x"],
+                        body_params["drag_coef_y"],
+                        body_params["drag_coef_z"],
                     ]
-                ),
-                normal_areas=np.array(
+                ]
+            ),
+            normal_areas=np.array(
+                [
                     [
-                        [
-                            body_params["area_x"],
-                            body_params["area_y"],
-                            body_params["area_z"],
-                        ]
+                        body_params["area_x"],
+                        body_params["area_y"],
+                        body_params["area_z"],
                     ]
-                ),
-            )
+                ]
+            ),
+        )
 
-            # add all finlets
-            surfaces = list()
-            for finlet_id in [0, 1]:
-                # x axis fins
-                surfaces.append(
-                    LiftingSurface(
-                        p=self.p,
-                        physics_period=self.physics_period,
-                        np_random=self.np_random,
-                        uav_id=self.Id,
-                        surface_id=finlet_id,
-                        lifting_unit=np.array([0.0, 1.0, 0.0]),
-                        forward_unit=np.array([0.0, 0.0, -1.0]),
-                        **all_params["finlet_params"],
-                    )
+        # add all finlets
+        surfaces = list()
+        for finlet_id in [0, 1]:
+            # x axis fins
+            surfaces.append(
+                LiftingSurface(
+                    p=self.p,
+                    physics_period=self.physics_period,
+                    np_random=self.np_random,
+                    uav_id=self.Id,
+                    surface_id=finlet_id,
+                    lifting_unit=np.array([0.0, 1.0, 0.0]),
+                    forward_unit=np.array([0.0, 0.0, -1.0]),
+                    **all_params["finlet_params"],
                 )
-            for finlet_id in [2, 3]:
-                # y axis fins
-                surfaces.append(
-                    LiftingSurface(
-                        p=self.p,
-                        physics_period=self.physics_period,
-                        np_random=self.np_random,
-                        uav_id=self.Id,
-                        surface_id=finlet_id,
-                        lifting_unit=np.array([1.0, 0.0, 0.0]),
-                        forward_unit=np.array([0.0, 0.0, -1.0]),
-                        **all_params["finlet_params"],
-                    )
+            )
+        for finlet_id in [2, 3]:
+            # y axis fins
+            surfaces.append(
+                LiftingSurface(
+                    p=self.p,
+                    physics_period=self.physics_period,
+                    np_random=self.np_random,
+                    uav_id=self.Id,
+                    surface_id=finlet_id,
+                    lifting_unit=np.array([1.0, 0.0, 0.0]),
+                    forward_unit=np.array([0.0, 0.0, -1.0]),
+                    **all_params["finlet_params"],
                 )
-            self.lifting_surfaces = LiftingSurfaces(lifting_surfaces=surfaces)
-
-            # mixing matrix to map finlet force command to finlet movement
-            # force_x, force_y, yaw
-            self.finlet_map = np.array(
-                [
-                    [+0.0, +1.0, +1.0],  # pos_x fin
-                    [+0.0, +1.0, -1.0],  # neg_x fin
-                    [+1.0, +0.0, -1.0],  # pos_y fin
-                    [+1.0, +0.0, +1.0],  # neg_y fin
-                ]
             )
+        self.lifting_surfaces = LiftingSurfaces(lifting_surfaces=surfaces)
+
+        # mixing matrix to map finlet force command to finlet movement
+        # force_x, force_y, yaw
+        self.finlet_map = np.array(
+            [
+                [+0.0, +1.0, +1.0],  # pos_x fin
+                [+0.0, +1.0, -1.0],  # neg_x fin
+                [+1.0, +0.0, -1.0],  # pos_y fin
+                [+1.0, +0.0, +1.0],  # neg_y fin
+            ]
+        )
 
-            # add the booster
-            self.boosters = Boosters(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                uav_id=self.Id,
-                booster_ids=np.array([1], dtype=int),
-                fueltank_ids=np.array([0], dtype=int),
-                tau=np.array([booster_params["booster_tau"]]),
-                total_fuel_mass=np.array([booster_params["total_fuel"]]),
-                max_fuel_rate=np.array([booster_params["max_fuel_rate"]]),
-                max_inertia=np.array(
+        # add the booster
+        self.boosters = Boosters(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            uav_id=self.Id,
+            booster_ids=np.array([1], dtype=int),
+            fueltank_ids=np.array([0], dtype=int),
+            tau=np.array([booster_params["booster_tau"]]),
+            total_fuel_mass=np.array([booster_params["total_fuel"]]),
+            max_fuel_rate=np.array([booster_params["max_fuel_rate"]]),
+            max_inertia=np.array(
+                [
                     [
-                        [
-                            booster_params["inertia_ixx"],
-                            booster_params["inertia_iyy"],
-                            booster_params["inertia_izz"],
-                        ]
+                        booster_params["inertia_ixx"],
+                        booster_params["inertia_iyy"],
+                        booster_params["inertia_izz"],
                     ]
-                ),
-                min_thrust=np.array([booster_params["min_thrust"]]),
-                max_thrust=np.array([booster_params["max_thrust"]]),
-                thrust_unit=np.array([[0.0, 0.0, 1.0]]),
-                reignitable=np.array([booster_params["reignitable"]], dtype=bool),
-                noise_ratio=np.array([booster_params["noise_ratio"]]),
-            )
+                ]
+            ),
+            min_thrust=np.array([booster_params["min_thrust"]]),
+            max_thrust=np.array([booster_params["max_thrust"]]),
+            thrust_unit=np.array([[0.0, 0.0, 1.0]]),
+            reignitable=np.array([booster_params["reignitable"]], dtype=bool),
+            noise_ratio=np.array([booster_params["noise_ratio"]]),
+        )
 
-            # add the gimbal for the booster
-            self.booster_gimbal = Gimbals(
-                p=self.p,
-                physics_period=self.physics_period,
-                np_random=self.np_random,
-                gimbal_unit_1=np.array([[1.0, 0.0, 0.0]]),
-                gimbal_unit_2=np.array([[0.0, 1.0, 0.0]]),
-                gimbal_tau=np.array([booster_params["gimbal_tau"]]),
-                gimbal_range_degrees=np.array(
-                    [[booster_params["gimbal_range_degrees"]] * 2]
-                ),
-            )
+        # add the gimbal for the booster
+        self.booster_gimbal = Gimbals(
+            p=self.p,
+            physics_period=self.physics_period,
+            np_random=self.np_random,
+            gimbal_unit_1=np.array([[1.0, 0.0, 0.0]]),
+            gimbal_unit_2=np.array([[0.0, 1.0, 0.0]]),
+            gimbal_tau=np.array([booster_params["gimbal_tau"]]),
+            gimbal_range_degrees=np.array(
+                [[booster_params["gimbal_range_degrees"]] * 2]
+            ),
+        )
 
         """ CAMERA """
         self.use_camera = use_camera
@@ -302,19 +301,13 @@ class Rocket(DroneClass):
 
         This includes: ang_vel, ang_pos, lin_vel, lin_pos.
         """
-        lin_pos, ang_pos = self.p.getBasePositionAndOrientation(self.Id)
-        lin_vel, ang_vel = self.p.getBaseVelocity(self.Id)
+        lin_pos, ang_pos = self._get_pos_orn(self.Id)
+        lin_vel, ang_vel = self._get_vel(self.Id)
 
-        # express vels in local frame
-        rotation = np.array(self.p.getMatrixFromQuaternion(ang_pos)).reshape(3, 3).T
-        lin_vel = np.matmul(rotation, lin_vel)
-        ang_vel = np.matmul(rotation, ang_vel)
-
-        # ang_pos in euler form
-        ang_pos = self.p.getEulerFromQuaternion(ang_pos)
-
-        # create the state
-        self.state = np.stack([ang_vel, ang_pos, lin_vel, lin_pos], axis=0)
+        # update the state in place, with vels in the local frame and ang_pos in euler form
+        rotation = self._jitted_compute_state(
+            self.state, lin_pos, ang_pos, lin_vel, ang_vel
+        )
 
         # update all bodies, which is just the booster here
         self.bodies.state_update(rotation)
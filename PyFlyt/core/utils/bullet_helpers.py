@@ -0,0 +1,14 @@
+"""Shared constants for the pybullet calls made on every physics step.
+
+Every attribute lookup on a `BulletClient` goes through its `__getattr__`, which wraps the pybullet function in a new `functools.partial`.
+Anything that calls into pybullet on every physics step therefore binds the functions it needs once on construction,
+and takes the constants below from here instead of looking them up on the client.
+"""
+
+import pybullet as p
+
+# forces and torques are applied in the frame of the link they act on
+LINK_FRAME = p.LINK_FRAME
+
+# forces are applied at the center of mass of the link they act on
+ZERO_POSITION = [0.0, 0.0, 0.0]
@@ -0,0 +1,42 @@
+"""Convenience function to load the parameters of a drone model."""
+
+from __future__ import annotations
+
+import copy
+import os
+from functools import lru_cache
+from typing import Any
+
+import yaml
+
+
+def load_drone_params(param_path: str) -> dict[str, Any]:
+    """Loads the parameters of a drone model from its yaml file.
+
+    The parsed file is cached, so spawning many drones of the same model only parses it once.
+    Edits to the file are still picked up, since the cache is keyed on its modification time.
+
+    Args:
+        param_path (str): path to the yaml file of the drone model
+
+    Returns:
+        dict[str, Any]: all parameters of the drone model, free to be modified by the caller
+
+    """
+    return copy.deepcopy(_load_drone_params(param_path, os.path.getmtime(param_path)))
+
+
+@lru_cache(maxsize=None)
+def _load_drone_params(param_path: str, mtime: float) -> dict[str, Any]:
+    """Parses the yaml file of a drone model, cached on the path and modification time.
+
+    Args:
+        param_path (str): path to the yaml file of the drone model
+        mtime (float): modification time of the file, only used as part of the cache key
+
+    Returns:
+        dict[str, Any]: all parameters of the drone model, shared between calls
+
+    """
+    with open(param_path, "rb") as f:
+        return yaml.safe_load(f)
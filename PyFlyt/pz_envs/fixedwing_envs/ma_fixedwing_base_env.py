@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Literal, Sequence
 
+import numba as nb
 import numpy as np
 from gymnasium import Space, spaces
 from pettingzoo import ParallelEnv
@@ -11,6 +12,9 @@ from pettingzoo import ParallelEnv
 from PyFlyt.core import Aviary
 from PyFlyt.core.utils.compile_helpers import jitter
 
+# below this many aircraft, waking the thread pool costs more than the trig it spreads out
+_PARALLEL_ROTATION_MIN_AIRCRAFT = 256
+
 
 class MAFixedwingBaseEnv(ParallelEnv):
     """Base Dogfighting Environment for the Aggressor model using custom environment API."""
@@ -277,7 +281,7 @@ class MAFixedwingBaseEnv(ParallelEnv):
         """
         raise NotImplementedError
 
-    def step(self, actions: dict[str, np.ndarray]) -> tuple[
+    def step(self, actions: dict[str, np.ndarray] | np.ndarray) -> tuple[
         dict[str, Any],
         dict[str, float],
         dict[str, bool],
@@ -287,21 +291,27 @@ class MAFixedwingBaseEnv(ParallelEnv):
         """step.
 
         Args:
-            actions (dict[str, np.ndarray]): actions
+            actions (dict[str, np.ndarray] | np.ndarray): actions keyed by agent name, or a [num_possible_agents, *action_shape] array indexed by agent id
 
         Returns:
             tuple[dict[str, Any], dict[str, float], dict[str, bool], dict[str, bool], dict[str, dict[str, Any]]]:
 
         """
         # copy over the past actions
-        self.past_actions = self.current_actions.copy()
+        np.copyto(self.past_actions, self.current_actions)
 
         # set the new actions and send to aviary
         # this automatically sets terminated agent actions to 0
-        self.current_actions = np.zeros_like(self.current_actions)
-        for k, v in actions.items():
-            if k in self.agents:
-                self.current_actions[self.agent_name_mapping[k]] = v
+        # an array of actions is copied over in one go, only keeping the rows of live agents
+        self.current_actions.fill(0.0)
+        if isinstance(actions, np.ndarray):
+            alive = np.zeros((self.num_possible_agents, 1), dtype=bool)
+            alive[[self.agent_name_mapping[ag] for ag in self.agents]] = True
+            np.copyto(self.current_actions, actions, where=alive)
+        else:
+            for k, v in actions.items():
+                if k in self.agents:
+                    self.current_actions[self.agent_name_mapping[k]] = v
 
         # pass things to the aviary, but clip throttle
         aviary_action = self.current_actions.copy()
@@ -349,60 +359,55 @@ class MAFixedwingBaseEnv(ParallelEnv):
             np.ndarray: an [n, 3] forward vector of each aircraft
 
         """
-        # use the jitted component to generate all the memory intensive copies
-        rx, ry, rz, forward_vector = (
-            MAFixedwingBaseEnv._jitted_compute_unit_rotation_forward(orn)
-        )
-
-        # order of operations for multiplication matters here
-        return rz @ ry @ rx, forward_vector
-
-    @staticmethod
-    @jitter
-    def _jitted_compute_unit_rotation_forward(orn: np.ndarray) -> tuple[
-        np.ndarray,
-        np.ndarray,
-        np.ndarray,
-        np.ndarray,
-    ]:
-        """Jitted unit to compute rotation matrices and forward vectors.
-
-        Args:
-            orn (np.ndarray): orn
-
-        Returns:
-            tuple[
-                    np.ndarray,
-                    np.ndarray,
-                    np.ndarray,
-                    np.ndarray,
-                ]:
-        """
-        # some general stuff
-        c, s = np.cos(orn), np.sin(orn)
-        eye = np.zeros((orn.shape[0], 3, 3), dtype=np.float64)
-        eye[:] = np.eye(3)
-
-        # create the rotation matrix
-        rx = eye.copy()
-        rx[:, 1, 1] = c[..., 0]
-        rx[:, 1, 2] = -s[..., 0]
-        rx[:, 2, 1] = s[..., 0]
-        rx[:, 2, 2] = c[..., 0]
-        ry = eye.copy()
-        ry[:, 0, 0] = c[..., 1]
-        ry[:, 0, 2] = s[..., 1]
-        ry[:, 2, 0] = -s[..., 1]
-        ry[:, 2, 2] = c[..., 1]
-        rz = eye.copy()
-        rz[:, 0, 0] = c[..., 2]
-        rz[:, 0, 1] = -s[..., 2]
-        rz[:, 1, 0] = s[..., 2]
-        rz[:, 1, 1] = c[..., 2]
-
-        # compute forward vector
-        forward_vector = np.stack(
-            (c[..., 2] * c[..., 1], s[..., 2] * c[..., 1], -s[..., 1]), axis=-1
-        )
-
-        return rx, ry, rz, forward_vector
+        # spreading over threads only pays for itself with a lot of aircraft
+        if orn.shape[0] >= _PARALLEL_ROTATION_MIN_AIRCRAFT:
+            return _jitted_compute_unit_rotation_forward_parallel(orn)
+        return _jitted_compute_unit_rotation_forward(orn)
+
+
+def _compute_unit_rotation_forward(
+    orn: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Computes rotation matrices and forward vectors, jitted below in serial and parallel flavours.
+
+    The rotation matrix is the ZYX Tait-Bryan composition `rz @ ry @ rx`, written out element by element.
+    Each aircraft is independent, so the loop is a `prange` that runs serially unless jitted with `parallel=True`.
+
+    Args:
+        orn (np.ndarray): orn
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+
+    """
+    rotation = np.empty((orn.shape[0], 3, 3), dtype=np.float64)
+    forward_vector = np.empty((orn.shape[0], 3), dtype=np.float64)
+
+    for i in nb.prange(orn.shape[0]):
+        cx, sx = np.cos(orn[i, 0]), np.sin(orn[i, 0])
+        cy, sy = np.cos(orn[i, 1]), np.sin(orn[i, 1])
+        cz, sz = np.cos(orn[i, 2]), np.sin(orn[i, 2])
+
+        # compute the rotation matrix
+        rotation[i, 0, 0] = cz * cy
+        rotation[i, 0, 1] = cz * sy * sx - sz * cx
+        rotation[i, 0, 2] = cz * sy * cx + sz * sx
+        rotation[i, 1, 0] = sz * cy
+        rotation[i, 1, 1] = sz * sy * sx + cz * cx
+        rotation[i, 1, 2] = sz * sy * cx - cz * sx
+        rotation[i, 2, 0] = -sy
+        rotation[i, 2, 1] = cy * sx
+        rotation[i, 2, 2] = cy * cx
+
+        # compute forward vector, the first column of the rotation matrix
+        forward_vector[i, 0] = cz * cy
+        forward_vector[i, 1] = sz * cy
+        forward_vector[i, 2] = -sy
+
+    return rotation, forward_vector
+
+
+_jitted_compute_unit_rotation_forward = jitter(_compute_unit_rotation_forward)
+_jitted_compute_unit_rotation_forward_parallel = jitter(
+    _compute_unit_rotation_forward, parallel=True
+)
@@ -306,7 +306,7 @@ class MAQuadXBaseEnv(ParallelEnv):
         """
         raise NotImplementedError
 
-    def step(self, actions: dict[str, np.ndarray]) -> tuple[
+    def step(self, actions: dict[str, np.ndarray] | np.ndarray) -> tuple[
         dict[str, Any],
         dict[str, float],
         dict[str, bool],
@@ -316,27 +316,34 @@ class MAQuadXBaseEnv(ParallelEnv):
         """step.
 
         Args:
-            actions (dict[str, np.ndarray]): actions
+            actions (dict[str, np.ndarray] | np.ndarray): actions keyed by agent name, or a [num_possible_agents, *action_shape] array indexed by agent id
 
         Returns:
             tuple[dict[str, Any], dict[str, float], dict[str, bool], dict[str, bool], dict[str, dict[str, Any]]]:
 
         """
         # copy over the past actions
-        self.past_actions = self.current_actions.copy()
+        np.copyto(self.past_actions, self.current_actions)
 
         # set the new actions and send to aviary
-        self.current_actions *= 0.0
-        for k, v in actions.items():
-            self.current_actions[self.agent_name_mapping[k]] = v
+        # an array of actions is copied over in one go, only keeping the rows of live agents
+        agent_ids = [self.agent_name_mapping[ag] for ag in self.agents]
+        self.current_actions.fill(0.0)
+        if isinstance(actions, np.ndarray):
+            alive = np.zeros((self.num_possible_agents, 1), dtype=bool)
+            alive[agent_ids] = True
+            np.copyto(self.current_actions, actions, where=alive)
+        else:
+            for k, v in actions.items():
+                self.current_actions[self.agent_name_mapping[k]] = v
         self.aviary.set_all_setpoints(self.current_actions)
 
-        # observation and rewards dictionary
-        observations = dict()
-        terminations = {k: False for k in self.agents}
-        truncations = {k: False for k in self.agents}
-        rewards = {k: 0.0 for k in self.agents}
-        infos = {k: dict() for k in self.agents}
+        # accumulate term, trunc, reward, info by agent id
+        # these are only turned into dictionaries once at the end of the step
+        term_by_id = np.zeros((self.num_possible_agents,), dtype=bool)
+        trunc_by_id = np.zeros((self.num_possible_agents,), dtype=bool)
+        rew_by_id = np.zeros((self.num_possible_agents,), dtype=np.float64)
+        info_by_id = [dict() for _ in range(self.num_possible_agents)]
 
         # step enough times for one RL step
         for _ in range(self.env_step_ratio):
@@ -345,20 +352,30 @@ class MAQuadXBaseEnv(ParallelEnv):
 
             # update reward, term, trunc, for each agent
             # TODO: make it so this doesn't have to be computed every aviary step
-            for ag in self.agents:
-                ag_id = self.agent_name_mapping[ag]
-
-                # compute term trunc reward
+            for ag_id in agent_ids:
                 term, trunc, rew, info = self.compute_term_trunc_reward_info_by_id(
                     ag_id
                 )
-                terminations[ag] |= term
-                truncations[ag] |= trunc
-                rewards[ag] += rew
-                infos[ag].update(info)
+                term_by_id[ag_id] |= term
+                trunc_by_id[ag_id] |= trunc
+                rew_by_id[ag_id] += rew
+                info_by_id[ag_id].update(info)
 
-                # compute observations
-                observations[ag] = self.compute_observation_by_id(ag_id)
+        # observation and rewards dictionary
+        observations = {
+            ag: self.compute_observation_by_id(ag_id)
+            for ag, ag_id in zip(self.agents, agent_ids)
+        }
+        terminations = {
+            ag: bool(term_by_id[ag_id]) for ag, ag_id in zip(self.agents, agent_ids)
+        }
+        truncations = {
+            ag: bool(trunc_by_id[ag_id]) for ag, ag_id in zip(self.agents, agent_ids)
+        }
+        rewards = {
+            ag: float(rew_by_id[ag_id]) for ag, ag_id in zip(self.agents, agent_ids)
+        }
+        infos = {ag: info_by_id[ag_id] for ag, ag_id in zip(self.agents, agent_ids)}
 
         # increment step count and cull dead agents for the next round
         self.step_count += 1
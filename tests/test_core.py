@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import itertools
+
 import numpy as np
+import pybullet as p
 import pytest
 from custom_uavs.rocket_brick import RocketBrick
 
 from PyFlyt.core import Aviary
-from PyFlyt.core.abstractions import ControlClass, WindFieldClass
+from PyFlyt.core.abstractions import PID, ControlClass, DroneClass, WindFieldClass
+from PyFlyt.core.drones.quadx import _jitted_update_control
+from PyFlyt.core.utils.load_params import load_drone_params
 
 
 def test_simple_spawn():
@@ -189,6 +194,13 @@ def test_custom_controller():
     for i in range(1000):
         env.step()
 
+    # re-registering the controller that is currently flying should swap it out in place
+    env.drones[0].register_controller(
+        controller_constructor=CustomController, controller_id=8, base_mode=6
+    )
+    for i in range(100):
+        env.step()
+
     env.disconnect()
 
 
@@ -338,3 +350,164 @@ def test_custom_wind(model: str):
         env.step()
 
     env.disconnect()
+
+
+def _reference_quadx_pwm(
+    mode: int,
+    pids: dict[str, PID],
+    state: np.ndarray,
+    setpoint: np.ndarray,
+    motor_map: np.ndarray,
+) -> np.ndarray:
+    """Runs the QuadX controller cascade as a chain of `PID` objects, the way it was written before being jitted.
+
+    Args:
+        mode (int): base flight mode
+        pids (dict[str, PID]): one controller per cascade stage
+        state (np.ndarray): (4, 3) state of the drone
+        setpoint (np.ndarray): (4,) setpoint of the drone
+        motor_map (np.ndarray): motor_map of the drone
+
+    Returns:
+        np.ndarray: (4,) array of motor pwm commands
+
+    """
+    a_output = setpoint[:3].copy()
+    z_output = setpoint[-1:].copy()
+
+    if mode == -1:
+        return np.array([*a_output, *z_output])
+
+    # attitude and lateral controllers
+    if mode in [0, 2]:
+        a_output = pids["ang_vel"].step(state[0], a_output)
+    elif mode in [1, 3]:
+        a_output = pids["ang_pos"].step(state[1], a_output)
+        a_output = pids["ang_vel"].step(state[0], a_output)
+    else:
+        if mode == 7:
+            a_output[:2] = pids["lin_pos"].step(state[3, :2], a_output[:2])
+        if mode in [6, 7]:
+            c, s = np.cos(state[1, -1]), np.sin(state[1, -1])
+            a_output[:2] = np.array([[c, -s], [s, c]]).T @ a_output[:2]
+        a_output[:2] = pids["lin_vel"].step(state[2, :2], a_output[:2])
+        a_output[:2] = np.array([-a_output[1], a_output[0]])
+        if mode == 7:
+            a_output = pids["ang_pos"].step(state[1], a_output)
+        else:
+            a_output[:2] = pids["ang_pos_xy"].step(state[1, :2], a_output[:2])
+        a_output = pids["ang_vel"].step(state[0], a_output)
+
+    # height controllers
+    if mode in [2, 3, 4, 7]:
+        z_output = pids["z_pos"].step(state[3, -1:], z_output)
+    if mode != 0:
+        z_output = pids["z_vel"].step(state[2, -1:], z_output)
+    z_output = np.clip(z_output, 0.0, 1.0)
+
+    # mix and deal with motor saturations
+    pwm = motor_map @ np.array([*a_output, *z_output])
+    high, low = np.max(pwm), np.min(pwm)
+    if high != low:
+        pwm_max, pwm_min = min(high, 1.0), max(low, 0.05)
+        add = (pwm_min - low) / (pwm_max - low) * (pwm_max - pwm)
+        sub = (high - pwm_max) / (high - pwm_min) * (pwm - pwm_min)
+        pwm += add - sub
+    return np.clip(pwm, 0.05, 1.0)
+
+
+@pytest.mark.parametrize("mode", [-1, 0, 1, 2, 3, 4, 5, 6, 7])
+def test_quadx_control_kernel(mode: int):
+    """Tests the jitted QuadX controller cascade against a chain of `PID` objects.
+
+    Args:
+        mode (int): base flight mode
+
+    """
+    env = Aviary(
+        start_pos=np.array([[0.0, 0.0, 1.0]]),
+        start_orn=np.array([[0.0, 0.0, 0.0]]),
+        render=False,
+        drone_type="quadx",
+    )
+    drone = env.drones[0]
+    ctrl_params = load_drone_params(drone.param_path)["control_params"]
+
+    # one reference controller per stage, the non position modes only control roll and pitch angles
+    def make_pid(stage: str, channels: slice = slice(None)) -> PID:
+        gains = [
+            np.array(ctrl_params[stage][gain], dtype=np.float64).flatten()[channels]
+            for gain in ["kp", "ki", "kd", "lim"]
+        ]
+        return PID(*gains, drone.control_period)
+
+    pids = {
+        stage: make_pid(stage)
+        for stage in ["ang_vel", "ang_pos", "lin_vel", "lin_pos", "z_pos", "z_vel"]
+    }
+    pids["ang_pos_xy"] = make_pid("ang_pos", slice(2))
+
+    # fresh controller states for the kernel
+    integral = np.zeros_like(drone.ctrl_kp)
+    prev_error = np.zeros_like(drone.ctrl_kp)
+    pwm = np.zeros((4,))
+
+    # random states and setpoints, large enough to hit the saturation handling
+    rng = np.random.default_rng(42)
+    for _ in range(200):
+        state = rng.normal(size=(4, 3))
+        setpoint = rng.normal(size=(4,)) * 2.0
+        if mode in [-1, 0]:
+            setpoint[-1] = rng.uniform(0.0, 1.0)
+
+        _jitted_update_control(
+            mode,
+            state,
+            setpoint,
+            drone.motor_map,
+            drone.ctrl_kp,
+            drone.ctrl_ki,
+            drone.ctrl_kd,
+            drone.ctrl_lim,
+            integral,
+            prev_error,
+            drone.control_period,
+            pwm,
+        )
+        expected = _reference_quadx_pwm(mode, pids, state, setpoint, drone.motor_map)
+        np.testing.assert_allclose(pwm, expected, rtol=1e-9, atol=1e-12)
+
+    env.disconnect()
+
+
+def test_compute_state_kernel():
+    """Tests the jitted state kernel against PyBullet's own quaternion conversions, including near gimbal lock."""
+    rng = np.random.default_rng(42)
+
+    # random orientations, plus pitch on and around +-90 degrees where pybullet special cases the euler angles
+    eulers = [rng.uniform(-np.pi, np.pi, size=(3,)) for _ in range(200)]
+    for sign, offset in itertools.product([-1.0, 1.0], [0.0, 1e-6, 1e-4, 1e-3, 1e-2]):
+        roll, yaw = rng.uniform(-np.pi, np.pi, size=(2,))
+        eulers.append(np.array([roll, sign * (np.pi / 2 - offset), yaw]))
+    eulers.append(np.array([0.3, np.pi / 2 - 1e-3, 0.7]))
+
+    state = np.zeros((4, 3))
+    for euler in eulers:
+        quaternion = p.getQuaternionFromEuler(euler)
+        lin_pos, lin_vel, ang_vel = rng.normal(size=(3, 3))
+
+        rotation = DroneClass._jitted_compute_state(
+            state, tuple(lin_pos), quaternion, tuple(lin_vel), tuple(ang_vel)
+        )
+
+        # the kernel rotates from the ground to the body frame
+        expected_rotation = np.array(p.getMatrixFromQuaternion(quaternion)).reshape(
+            3, 3
+        )
+        np.testing.assert_allclose(rotation, expected_rotation.T, atol=1e-12)
+        np.testing.assert_allclose(state[0], expected_rotation.T @ ang_vel, atol=1e-12)
+        np.testing.assert_allclose(
+            state[1], p.getEulerFromQuaternion(quaternion), atol=1e-9
+        )
+        np.testing.assert_allclose(state[2], expected_rotation.T @ lin_vel, atol=1e-12)
+        np.testing.assert_allclose(state[3], lin_pos, atol=0.0)
@@ -6,12 +6,20 @@ import itertools
 import warnings
 from typing import Any
 
+import numpy as np
+import pybullet as p
 import pytest
 from pettingzoo import ParallelEnv
 from pettingzoo.test import parallel_api_test
 from pettingzoo.test.seed_test import check_environment_deterministic_parallel
 
 from PyFlyt.pz_envs import MAFixedwingDogfightEnvV2, MAQuadXHoverEnvV2
+from PyFlyt.pz_envs.fixedwing_envs.ma_fixedwing_base_env import (
+    _PARALLEL_ROTATION_MIN_AIRCRAFT,
+    MAFixedwingBaseEnv,
+    _jitted_compute_unit_rotation_forward,
+    _jitted_compute_unit_rotation_forward_parallel,
+)
 
 _QUADX_HOVER_ENVS = []
 for env_class, angle_representation, sparse_reward in itertools.product(
@@ -110,3 +118,64 @@ def test_observation_action_space(env_config: tuple[type[ParallelEnv], dict[str,
             assert env.observation_space(k).contains(v)
 
     env.close()
+
+
+@pytest.mark.parametrize("env_config", _ALL_ENV_CONFIGS)
+def test_array_actions(env_config: tuple[type[ParallelEnv], dict[str, Any]]):
+    """Tests that stepping with an array of actions matches stepping with a dictionary of actions."""
+    env1 = env_config[0](**env_config[1])
+    env2 = env_config[0](**env_config[1])
+
+    observations1, _ = env1.reset(seed=42)
+    observations2, _ = env2.reset(seed=42)
+
+    rng = np.random.default_rng(42)
+    action_space = env1.action_space(env1.possible_agents[0])
+    for _ in range(100):
+        if not env1.agents:
+            break
+
+        # actions of dead agents in the array should be ignored
+        array_actions = rng.uniform(
+            action_space.low,
+            action_space.high,
+            size=(len(env1.possible_agents), *action_space.shape),
+        )
+        dict_actions = {
+            agent: array_actions[env1.agent_name_mapping[agent]]
+            for agent in env1.agents
+        }
+
+        observations1, rewards1, *_ = env1.step(dict_actions)
+        observations2, rewards2, *_ = env2.step(array_actions)
+
+        assert observations1.keys() == observations2.keys()
+        assert rewards1 == rewards2
+        for k in observations1:
+            np.testing.assert_equal(observations1[k], observations2[k])
+
+    env1.close()
+    env2.close()
+
+
+@pytest.mark.parametrize("num_aircraft", [2, _PARALLEL_ROTATION_MIN_AIRCRAFT])
+def test_compute_rotation_forward(num_aircraft: int):
+    """Tests that the aircraft rotations match the serial kernel and pybullet, on both sides of the parallel threshold."""
+    rng = np.random.default_rng(42)
+    orn = rng.uniform(-np.pi, np.pi, size=(num_aircraft, 3))
+
+    rotation, forward_vector = MAFixedwingBaseEnv.compute_rotation_forward(orn)
+
+    # the parallel kernel is only compiled on first use, so having a signature means it ran
+    if num_aircraft >= _PARALLEL_ROTATION_MIN_AIRCRAFT:
+        assert _jitted_compute_unit_rotation_forward_parallel.signatures
+
+    serial_rotation, serial_forward_vector = _jitted_compute_unit_rotation_forward(orn)
+    np.testing.assert_allclose(rotation, serial_rotation, atol=1e-15)
+    np.testing.assert_allclose(forward_vector, serial_forward_vector, atol=1e-15)
+
+    expected_rotation = np.array(
+        [p.getMatrixFromQuaternion(p.getQuaternionFromEuler(o)) for o in orn]
+    ).reshape(-1, 3, 3)
+    np.testing.assert_allclose(rotation, expected_rotation, atol=1e-12)
+    np.testing.assert_allclose(forward_vector, expected_rotation[..., 0], atol=1e-12)